@@ -70,12 +70,12 @@ def figure_type_and_special(item: Union[Comment, Level]) -> Optional[Tuple[int,
 def construct_levels(
     lvdata: Iterable[ExtDict], cdata: Iterable[ExtDict], sdata: Iterable[ExtDict], client: Client
 ) -> List[Level]:
-    creators = list(AbstractUser(**c, client=client) for c in cdata)
-    songs = list(Song.from_data(s, client=client) for s in sdata)
+    creators = {c.id: c for c in (AbstractUser(**data, client=client) for data in cdata)}
+    songs = {s.id: s for s in (Song.from_data(data, client=client) for data in sdata)}
     levels = []
 
     for data in lvdata:
-        song = utils.get(songs, id=data.getcast(Index.LEVEL_SONG_ID, 0, int))
+        song = songs.get(data.getcast(Index.LEVEL_SONG_ID, 0, int))
         if song is None:
             song = Song(
                 **Converter.to_normal_song(data.getcast(Index.LEVEL_AUDIO_TRACK, 0, int)),
@@ -83,7 +83,7 @@ def construct_levels(
             )
 
         creator_id = data.getcast(Index.LEVEL_CREATOR_ID, 0, int)
-        creator = utils.get(creators, id=creator_id)
+        creator = creators.get(creator_id)
         if creator is None:
             creator = AbstractUser(id=creator_id, name="unknown", account_id=0, client=client)
 
@@ -92,8 +92,9 @@ def construct_levels(
     return levels
 
 
-async def is_alive_mock(level: Level) -> bool:
+async def is_alive_mock(*args) -> bool:
     # mock Level's is_alive method if the level was deleted.
+    # this is set on the instance, so it is not bound and should accept any arguments.
     return False
 
 
@@ -121,6 +122,10 @@ class Client:
 
             Otherwise, if ``False`` or not found (extremely rarely), these methods will return ``None``.
 
+    max_concurrency: :class:`int`
+        Maximum amount of page requests to run at a time,
+        when fetching multiple pages (e.g. :meth:`.Client.search_levels`). Defaults to ``10``.
+
     \*\*http_args
         Arguments to pass to :class:`.HTTPClient` constructor.
 
@@ -148,12 +153,13 @@ class Client:
         *,
         loop: Optional[asyncio.AbstractEventLoop] = None,
         load_after_post: bool = True,
+        max_concurrency: int = 10,
         **http_args,
     ) -> None:
         if loop is None:
             loop = utils.acquire_loop()
 
-        self.session = Session(**http_args)
+        self.session = Session(max_concurrency=max_concurrency, **http_args)
         self.load_after_post = load_after_post
         self.listeners = list()
         self.loop = loop
@@ -229,7 +235,7 @@ class Client:
         Returns
         -------
         :class:`float`
-            Server ping, in milliseconds.
+            Server ping, in milliseconds, not rounded.
         """
         return await self.session.ping_server("http://boomlings.com/database/")
 
@@ -437,7 +443,7 @@ class Client:
 
         data = await self.session.get_user_songs(name, pages=pages)
 
-        return list(Song(**part, client=self) for part in data)
+        return [Song(**part, client=self) for part in data]
 
     async def get_user(self, account_id: int = 0) -> User:
         """|coro|
@@ -655,7 +661,7 @@ class Client:
             All gauntlets retrieved, as list.
         """
         data = await self.session.get_gauntlets()
-        return list(Gauntlet.from_data(part, client=self) for part in data)
+        return [Gauntlet.from_data(part, client=self) for part in data]
 
     async def get_page_map_packs(
         self, page: int = 0, *, raise_errors: bool = True
@@ -683,7 +689,7 @@ class Client:
             No map packs were found at the given page.
         """
         data = await self.session.get_page_map_packs(page=page)
-        return list(MapPack.from_data(part, client=self) for part in data)
+        return [MapPack.from_data(part, client=self) for part in data]
 
     async def get_map_packs(self, pages: Optional[Iterable[int]] = range(10)) -> List[MapPack]:
         """|coro|
@@ -701,7 +707,7 @@ class Client:
             List of map packs found.
         """
         data = await self.session.get_map_packs(pages=pages)
-        return list(MapPack.from_data(part, client=self) for part in data)
+        return [MapPack.from_data(part, client=self) for part in data]
 
     async def login(self, user: str, password: str) -> None:  # pragma: no cover
         """|coro|
@@ -948,9 +954,36 @@ class Client:
             A message to print after closing.
         """
         self._set_to_defaults()
+        self.session.forget_account_templates()
 
         log.info("Has logged out with message: %r", message)
 
+    async def close_session(self) -> None:
+        """|coro|
+
+        Close the HTTP session, freeing all connections that were kept alive.
+
+        This should be called when the client is no longer needed, unless the client
+        is used as an async context manager, which calls this method on exit:
+
+        .. code-block:: python3
+
+            async with gd.Client() as client:
+                ...  # use the client
+
+        Sessions are also closed when their event loop shuts down, which is done by
+        :func:`asyncio.run` and :func:`.utils.run`.
+
+        The session is created again on the next request, if any.
+        """
+        await self.session.close()
+
+    async def __aenter__(self) -> Client:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close_session()
+
     def temp_login(self, user: str, password: str) -> Any:
         """Async context manager, used for temporarily logging in.
 
@@ -1077,21 +1110,28 @@ class Client:
         )
 
     @check_logged
-    async def read_message(self, message: Message) -> str:
+    async def read_message(self, message: Message, force: bool = False) -> str:
         """|coro|
 
         Read a message.
 
+        If the message was already read, its body is returned without a request.
+
         Parameters
         ----------
         message: :class:`.Message`
             A message to read.
+        force: :class:`bool`
+            Whether to request the message even if its body is already known.
 
         Returns
         -------
         :class:`str`
             The content of the message.
         """
+        if message.body and not force:
+            return message.body
+
         body = await self.session.read_message(message.type, message.id, client=self)
         message.body = body
         message.options.update(is_read=True)
@@ -1381,6 +1421,9 @@ class Client:
         List[:class:`.Comment`]
             Retrieved comments.
         """
+        assert isinstance(page, int) and page >= 0
+        assert type in ("profile", "level")
+
         strategy = CommentStrategy.from_value(strategy)
         data = await self.session.retrieve_page_comments(
             user.account_id,
@@ -1390,7 +1433,7 @@ class Client:
             raise_errors=raise_errors,
             strategy=strategy,
         )
-        return list(Comment.from_data(part, user, client=self) for part in data)
+        return [Comment.from_data(part, user, client=self) for part in data]
 
     async def retrieve_comments(
         self,
@@ -1426,7 +1469,7 @@ class Client:
         data = await self.session.retrieve_comments(
             user.account_id, user.id, type=type, pages=pages, strategy=strategy
         )
-        return list(Comment.from_data(part, user, client=self) for part in data)
+        return [Comment.from_data(part, user, client=self) for part in data]
 
     async def report_level(self, level: Level) -> None:
         """|coro|
@@ -1613,7 +1656,7 @@ class Client:
         """
         strategy = LevelLeaderboardStrategy.from_value(strategy)
         data = await self.session.get_leaderboard(level.id, strategy=strategy, client=self)
-        return list(LevelRecord.from_data(part, strategy=strategy, client=self) for part in data)
+        return [LevelRecord.from_data(part, strategy=strategy, client=self) for part in data]
 
     async def get_level_comments(
         self, level: Level, strategy: Union[int, str, CommentStrategy] = 0, amount: int = 20
@@ -1645,7 +1688,7 @@ class Client:
         data = await self.session.get_level_comments(
             level_id=level.id, strategy=CommentStrategy.from_value(strategy), amount=amount
         )
-        return list(Comment.from_data(part, user_data, client=self) for (part, user_data) in data)
+        return [Comment.from_data(part, user_data, client=self) for (part, user_data) in data]
 
     @check_logged
     async def get_blocked_users(self) -> List[AbstractUser]:
@@ -1667,7 +1710,7 @@ class Client:
             No blocked users were found. Cool.
         """
         data = await self.session.get_user_list(type=1, client=self)
-        return list(AbstractUser.from_data(part, client=self) for part in data)
+        return [AbstractUser.from_data(part, client=self) for part in data]
 
     @check_logged
     async def get_friends(self) -> List[AbstractUser]:
@@ -1689,7 +1732,7 @@ class Client:
             No friends were found. Sadly...
         """
         data = await self.session.get_user_list(type=0, client=self)
-        return list(AbstractUser.from_data(part, client=self) for part in data)
+        return [AbstractUser.from_data(part, client=self) for part in data]
 
     @check_logged
     async def to_user(self) -> User:
@@ -1742,7 +1785,7 @@ class Client:
         data = await self.session.get_page_messages(
             sent_or_inbox=sent_or_inbox, page=page, raise_errors=raise_errors, client=self
         )
-        return list(Message.from_data(part, self.get_parse_dict(), client=self) for part in data)
+        return [Message.from_data(part, self.get_parse_dict(), client=self) for part in data]
 
     @check_logged
     async def get_messages(
@@ -1770,7 +1813,7 @@ class Client:
             sent_or_inbox=sent_or_inbox, pages=pages, client=self
         )
 
-        return list(Message.from_data(part, self.get_parse_dict(), client=self) for part in data)
+        return [Message.from_data(part, self.get_parse_dict(), client=self) for part in data]
 
     @check_logged
     async def get_page_friend_requests(
@@ -1807,11 +1850,9 @@ class Client:
             No friend requests were found. Raised if ``raise_errors`` is ``True``.
         """
         data = await self.session.get_page_friend_requests(
-            sent_or_inbox=sent_or_inbox, page=page, raise_errors=raise_errors, client=self
-        )
-        return list(
-            FriendRequest.from_data(part, self.get_parse_dict(), client=self) for part in data
+            inbox=int(sent_or_inbox == "sent"), page=page, raise_errors=raise_errors, client=self
         )
+        return [FriendRequest.from_data(part, self.get_parse_dict(), client=self) for part in data]
 
     @check_logged
     async def get_friend_requests(
@@ -1838,9 +1879,7 @@ class Client:
         data = await self.session.get_friend_requests(
             sent_or_inbox=sent_or_inbox, pages=pages, client=self
         )
-        return list(
-            FriendRequest.from_data(part, self.get_parse_dict(), client=self) for part in data
-        )
+        return [FriendRequest.from_data(part, self.get_parse_dict(), client=self) for part in data]
 
     @check_logged
     def get_parse_dict(self) -> ExtDict:
@@ -1884,7 +1923,7 @@ class Client:
         """
         strategy = LeaderboardStrategy.from_value(strategy)
         data = await self.session.get_top(strategy=strategy, count=count, client=self)
-        return list(UserStats.from_data(part, client=self) for part in data)
+        return [UserStats.from_data(part, client=self) for part in data]
 
     async def get_leaderboard(
         self, strategy: Union[int, str, LeaderboardStrategy] = 0, *, count: int = 100
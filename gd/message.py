@@ -98,17 +98,24 @@ class Message(AbstractEntity):
         """:class:`bool`: Indicates whether message is read or not."""
         return bool(self.options.get("is_read"))
 
-    async def read(self) -> str:
+    async def read(self, force: bool = False) -> str:
         """|coro|
 
         Read a message. Set the body of the message to the content.
 
+        If the message was already read, the body is returned without a request.
+
+        Parameters
+        ----------
+        force: :class:`bool`
+            Whether to request the message even if its body is already known.
+
         Returns
         -------
         :class:`str`
             The content of the message.
         """
-        return await self.client.read_message(self)
+        return await self.client.read_message(self, force=force)
 
     async def reply(self, content: str, schema: Optional[str] = None) -> None:
         """|coro|
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import operator
 
 # import random
 import time  # for perf_counter in ping
@@ -9,6 +10,7 @@ from yarl import URL
 
 from .typing import (
     Any,
+    Awaitable,
     Client,
     Dict,
     Iterable,
@@ -26,6 +28,9 @@ from .errors import (
     LoginFailure,
 )
 
+from .logging import get_logger
+
+from .utils._async import run_blocking_io
 from .utils.converter import Converter
 from .utils.decorators import check_logged_obj
 from .utils.enums import (
@@ -56,24 +61,136 @@ from .utils.crypto.coders import Coder
 
 from . import api
 
+log = get_logger(__name__)
+
+USER_INFO_TTL = 60  # seconds
+USER_INFO_CACHE_SIZE = 512
+
+ICON_CACHE_SIZE = 512
+
+UPLOAD_EXTRA_STRING = "_".join(["0"] * 55)
+UPLOAD_LEVEL_INFO = "H4sIAAAAAAAAC_NIrVQoyUgtStVRCMpPSi0qUbDStwYAsgpl1RUAAAA="
+UPLOAD_OPTION_NAMES = {
+    name: Converter.snake_to_camel(name)
+    for name in (
+        "level_name",
+        "level_desc",
+        "level_version",
+        "level_length",
+        "audio_track",
+        "auto",
+        "original",
+        "two_player",
+        "objects",
+        "coins",
+        "requested_stars",
+        "unlisted",
+        "ldm",
+        "password",
+        "level_string",
+        "extra_string",
+        "level_info",
+    )
+}
+
+# errors that pages past the last one (or otherwise empty ones) fail with
+PAGE_ERRORS = (MissingAccess, NothingFound)
+
+MESSAGE_TYPE_NAMES = {type: type.name.lower() for type in MessageOrRequestType}
+
+PROFILE_CHK_KEYS = (
+    "user_coins",
+    "demons",
+    "stars",
+    "coins",
+    "icon_type",
+    "icon",
+    "diamonds",
+    "acc_icon",
+    "acc_ship",
+    "acc_ball",
+    "acc_bird",
+    "acc_dart",
+    "acc_robot",
+    "acc_glow",
+    "acc_spider",
+    "acc_explosion",
+)
+get_profile_chk_values = operator.itemgetter(*PROFILE_CHK_KEYS)
+PROFILE_SETTING_NAMES = {
+    name: Converter.snake_to_camel(name)
+    for name in PROFILE_CHK_KEYS + ("color1", "color2", "special")
+}
+
+parse_colon_mapping = Parser().with_split(":").should_map().compile()
+parse_song_mapping = Parser().with_split("~|~").should_map().compile()
+parse_first_user = Parser().split("#").take(0).check_empty().split(":").should_map().compile()
+parse_page_rows = Parser().split("#").take(0).check_empty().split("|").compile()
+parse_tilde_mapping = Parser().with_split("~").should_map().compile()
+parse_profile_comment = Parser().with_split("~").add_ext({"101": 1}).should_map().compile()
+parse_comment_history = (
+    Parser().split(":").take(0).split("~").add_ext({"101": 0}).should_map().compile()
+)
+parse_level_mapping = (
+    Parser().with_split(":").add_ext({"101": 0, "102": -1, "103": -1}).should_map().compile()
+)
+
 
 class Session:
     """Implements all requests-related functionality.
     No docstrings here yet...
     """
 
-    def __init__(self, **http_args) -> None:
+    def __init__(self, *, max_concurrency: int = 10, **http_args) -> None:
         self.http = HTTPClient(**http_args)
+        self.max_concurrency = max_concurrency
+        self.user_info_cache = {}
+        self.icon_cache = {}
+        self.icon_locks = {}
+        self.account_templates = {}
+        self.template_credentials = None
 
     def __repr__(self) -> str:
-        info = {"http": self.http}
+        info = {"http": self.http, "max_concurrency": self.max_concurrency}
         return make_repr(self, info)
 
+    async def close(self) -> None:
+        self.forget_account_templates()
+        await self.http.close()
+
+    def forget_account_templates(self) -> None:
+        # templates contain (encoded) password, so they should not outlive logging out
+        self.account_templates.clear()
+        self.template_credentials = None
+
+    def account_params(self, client: Client, game_version: Union[int, str] = 21) -> Params:
+        # start parameters with account ID and (encoded) password of the client
+        credentials = (client.account_id, client.encodedpass)
+
+        if credentials != self.template_credentials:
+            self.forget_account_templates()
+            self.template_credentials = credentials
+
+        key = (game_version, Params.GDW)
+        template = self.account_templates.get(key)
+
+        if template is None:
+            template = self.account_templates[key] = (
+                Params()
+                .create_new(game_version)
+                .put_definer("accountid", client.account_id)
+                .put_password(client.encodedpass)
+                .close()
+            )
+
+        return Params.from_template(template)
+
     async def ping_server(self, link: str) -> float:
+        # use a new session, so that the time includes establishing a connection
         start = time.perf_counter()
-        await self.http.normal_request(link)
+        await self.http.normal_request(link, new_session=True)
         end = time.perf_counter()
-        return round((end - start) * 1000, 2)
+        return (end - start) * 1000
 
     async def get_song(self, song_id: int = 0) -> ExtDict:
         payload = Params().create_new().put_definer("song", song_id).finish()
@@ -82,7 +199,7 @@ class Session:
             -2: SongRestrictedForUsage(song_id),
         }
         resp = await self.http.request(Route.GET_SONG_INFO, payload, error_codes=codes)
-        return Parser().with_split("~|~").should_map().parse(resp)
+        return parse_song_mapping(resp)
 
     async def test_song(self, song_id: int = 0) -> ExtDict:
         codes = {-1: MissingAccess(f"Failed to fetch artist info for ID: {song_id}")}
@@ -102,13 +219,12 @@ class Session:
 
     async def get_ng_song(self, song_id: int = 0) -> ExtDict:
         # just like get_song(), but gets anything available on NG.
-        link = Route.NEWGROUNDS_SONG_LISTEN + str(song_id)
+        link = f"{Route.NEWGROUNDS_SONG_LISTEN}{song_id}"
 
         content = await self.http.normal_request(link)
-        html = content.decode().replace("\\", "")
 
         try:
-            info = find_song_info(html)
+            info = find_song_info(content.decode(errors="replace"))
         except ValueError:
             raise MissingAccess(f"Song was not found by ID: {song_id}") from None
 
@@ -166,29 +282,62 @@ class Session:
 
         return await self.run_many(to_run)
 
-    async def get_user(self, account_id: int = 0, return_only_stats: bool = False) -> ExtDict:
+    async def get_user_info(
+        self,
+        account_id: int,
+        error_codes: Optional[Dict[int, Exception]] = None,
+        *,
+        use_cache: bool = False,
+    ) -> ExtDict:
+        # fetch user info by account ID; if "use_cache" is set, recent results are reused
+        now = time.monotonic()
+
+        if use_cache:
+            cached = self.user_info_cache.get(account_id)
+
+            if cached is not None and now - cached[0] < USER_INFO_TTL:
+                return ExtDict(cached[1])
+
         payload = Params().create_new().put_definer("user", account_id).finish()
+
+        resp = await self.http.request(Route.GET_USER_INFO, payload, error_codes=error_codes)
+        mapped = parse_colon_mapping(resp)
+
+        if mapped is not None:
+            if len(self.user_info_cache) >= USER_INFO_CACHE_SIZE:
+                # remove the oldest entry, since dicts preserve insertion order
+                del self.user_info_cache[next(iter(self.user_info_cache))]
+
+            self.user_info_cache[account_id] = (now, ExtDict(mapped))
+
+        return mapped
+
+    def forget_user_info(self, *account_ids: int) -> None:
+        # drop cached user info, for instance after a client changes its own profile
+        for account_id in account_ids:
+            self.user_info_cache.pop(account_id, None)
+
+    async def get_user_search_info(
+        self, query: Union[int, str], error_codes: Optional[Dict[int, Exception]] = None
+    ) -> Optional[ExtDict]:
+        # fetch the first user found by the query
+        payload = (
+            Params().create_new().put_definer("search", query).put_total(0).put_page(0).finish()
+        )
+
+        resp = await self.http.request(Route.USER_SEARCH, payload, error_codes=error_codes)
+
+        return parse_first_user(resp)
+
+    async def get_user(self, account_id: int = 0, return_only_stats: bool = False) -> ExtDict:
         codes = {-1: MissingAccess(f"No users were found with ID: {account_id}.")}
 
-        resp = await self.http.request(Route.GET_USER_INFO, payload, error_codes=codes)
-        mapped = Parser().with_split(":").should_map().parse(resp)
+        mapped = await self.get_user_info(account_id, error_codes=codes)
 
         if return_only_stats:
             return mapped
 
-        another = (
-            Params()
-            .create_new()
-            .put_definer("search", mapped.getcast(Index.USER_PLAYER_ID, 0, int))
-            .put_total(0)
-            .put_page(0)
-            .finish()
-        )
-        some_resp = await self.http.request(Route.USER_SEARCH, another)
-
-        new_resp = (
-            Parser().split("#").take(0).check_empty().split(":").should_map().parse(some_resp)
-        )
+        new_resp = await self.get_user_search_info(mapped.getcast(Index.USER_PLAYER_ID, 0, int))
 
         if new_resp is None:
             raise codes.get(-1)
@@ -200,14 +349,9 @@ class Session:
         return mapped
 
     async def search_user(self, query: Union[int, str], return_abstract: bool = False) -> ExtDict:
-
-        payload = (
-            Params().create_new().put_definer("search", query).put_total(0).put_page(0).finish()
-        )
         codes = {-1: MissingAccess(f"Searching for {query!r} failed.")}
 
-        resp = await self.http.request(Route.USER_SEARCH, payload, error_codes=codes)
-        mapped = Parser().split("#").take(0).check_empty().split(":").should_map().parse(resp)
+        mapped = await self.get_user_search_info(query, error_codes=codes)
 
         if mapped is None:
             raise codes.get(-1)
@@ -218,10 +362,7 @@ class Session:
             return mapped
 
         # ok; if we should not return abstract, let's find all other parameters
-        payload = Params().create_new().put_definer("user", account_id).finish()
-
-        resp = await self.http.request(Route.GET_USER_INFO, payload, error_codes=codes)
-        mapped.update(Parser().with_split(":").should_map().parse(resp))
+        mapped.update(await self.get_user_info(account_id, error_codes=codes, use_cache=True))
 
         return mapped
 
@@ -241,7 +382,8 @@ class Session:
         payload = Params().create_new().put_definer("levelid", level_id).finish()
         resp = await self.http.request(Route.DOWNLOAD_LEVEL, payload, error_codes=codes)
 
-        level_data = Parser().split("#").take(0).split(":").add_ext(ext).should_map().parse(resp)
+        level_data = parse_colon_mapping(resp.partition("#")[0])
+        level_data.update(ext)
 
         real_id = level_data.getcast(Index.LEVEL_ID, 0, int)
 
@@ -254,26 +396,28 @@ class Session:
         )
         resp = await self.http.request(Route.LEVEL_SEARCH, payload, error_codes=codes)
 
-        if not resp or resp.count("#") < 2:
+        if not resp:
             raise codes.get(-1)
 
-        data = resp.split("#")
+        # only the first three parts are needed: levels, creators and songs
+        data = resp.split("#", 3)
 
-        # getting song
-        song_data = data[2]
+        if len(data) < 3:
+            raise codes.get(-1)
+
+        _, creator_data, song_data = data[:3]
 
+        # getting song
         if not song_data:
             song = Converter.to_normal_song(level_data.getcast(Index.LEVEL_AUDIO_TRACK, 0, int))
         else:
-            song = Parser().with_split("~|~").should_map().parse(song_data)
+            song = parse_song_mapping(song_data)
 
         # getting creator
-        creator_data = data[1]
-
         if not creator_data:
             id, name, account_id = (0, "unknown", 0)
         else:
-            id, name, account_id = creator_data.split(":")
+            id, name, account_id = creator_data.split(":", 2)
 
         creator = ExtDict(id=id, name=name, account_id=account_id)
 
@@ -321,9 +465,10 @@ class Session:
         *,
         client: Client,
     ) -> int:
-        data = Coder.zip(data)
-        extra_string = "_".join(map(str, (0 for _ in range(55))))
-        desc = Coder.do_base64(desc)
+        # compressing and encoding can take a while for large levels, so do it in executor
+        data, desc = await asyncio.gather(
+            run_blocking_io(Coder.zip, data), run_blocking_io(Coder.do_base64, desc)
+        )
 
         upload_seed = Coder.gen_level_upload_seed(data)
         seed2 = Coder.gen_chk(type="level", values=[upload_seed])
@@ -340,16 +485,13 @@ class Session:
             pwd = add + int(password)
 
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
+            self.account_params(client)
             .put_definer("levelid", level_id)
             .put_definer("song", song_id)
             .put_seed(seed)
             .put_seed(seed2, suffix=2)
             .put_seed(0, prefix="wt")
             .put_seed(0, prefix="wt", suffix=2)
-            .put_password(client.encodedpass)
             .put_username(client.name)
             .finish()
         )
@@ -370,13 +512,11 @@ class Session:
             "ldm": int(ldm),
             "password": pwd,
             "level_string": data,
-            "extra_string": extra_string,
-            "level_info": "H4sIAAAAAAAAC_NIrVQoyUgtStVRCMpPSi0qUbDStwYAsgpl1RUAAAA=",
+            "extra_string": UPLOAD_EXTRA_STRING,
+            "level_info": UPLOAD_LEVEL_INFO,
         }
 
-        payload_cased = {
-            Converter.snake_to_camel(key): str(value) for key, value in options.items()
-        }
+        payload_cased = {UPLOAD_OPTION_NAMES[key]: str(value) for key, value in options.items()}
 
         payload.update(payload_cased)
 
@@ -388,23 +528,14 @@ class Session:
         return level_id
 
     async def get_user_list(self, type: int = 0, *, client: Client) -> List[ExtDict]:
-        payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
-            .put_type(type)
-            .finish()
-        )
+        payload = self.account_params(client).put_type(type).finish()
         codes = {
             -1: MissingAccess("Failed to fetch a user list."),
             -2: NothingFound("gd.AbstractUser"),
         }
 
         resp = await self.http.request(Route.GET_USER_LIST, payload, error_codes=codes)
-        resp, parser = resp.split("|"), Parser().with_split(":").should_map()
-
-        return list(map(parser.parse, resp))
+        return [parse_colon_mapping(user) for user in resp.split("|")]
 
     async def get_leaderboard(
         self, level_id: int, strategy: LevelLeaderboardStrategy, *, client: Client
@@ -425,12 +556,7 @@ class Session:
         # chk = Coder.gen_chk(type='levelscore', values=values)
 
         params = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_definer("levelid", level_id)
-            .put_password(client.encodedpass)
-            .put_type(strategy.value)
+            self.account_params(client).put_definer("levelid", level_id).put_type(strategy.value)
         )
 
         # params.put_percent(percentage).put_chk(chk)
@@ -450,12 +576,12 @@ class Session:
         if not resp:
             return list()
 
-        resp, parser = (
-            resp.split("|"),
-            Parser().with_split(":").add_ext({"101": level_id}).should_map(),
-        )
+        records = [parse_colon_mapping(record) for record in resp.split("|") if record]
 
-        return list(map(parser.parse, filter(is_not_empty, resp)))
+        for record in records:
+            record["101"] = level_id
+
+        return records
 
     async def get_top(
         self, strategy: LeaderboardStrategy, count: int, *, client: Client
@@ -475,9 +601,7 @@ class Session:
         payload = params.finish()
 
         resp = await self.http.request(Route.GET_USER_TOP, payload, error_codes=codes)
-        resp, parser = resp.split("|"), Parser().with_split(":").should_map()
-
-        return list(map(parser.parse, filter(is_not_empty, resp)))
+        return [parse_colon_mapping(user) for user in resp.split("|") if user]
 
     async def login(self, user: str, password: str) -> Tuple[int, int]:
         # account_id, id
@@ -514,7 +638,8 @@ class Session:
         try:
             main, levels, *_ = resp.split(";")
             db = await api.save.from_string_async(main, levels, xor=False)
-            save = await SaveParser.aio_parse(db.main.dump())
+            # main part is already parsed, so there is no need to dump and parse it again
+            save = SaveParser.parse_dict(db.main)
 
             return db, save
 
@@ -546,30 +671,23 @@ class Session:
         if resp != 1:
             raise MissingAccess(f"Failed to do backup for client: {client!r}")
 
-    async def search_levels_on_page(
+    def get_level_search_template(
         self,
-        page: int = 0,
         query: str = "",
         filters: Optional[Filters] = None,
         user_id: Optional[int] = None,
         gauntlet: Optional[int] = None,
         *,
-        raise_errors: bool = True,
         client: Client,
-    ) -> Tuple[List[ExtDict], List[ExtDict], List[ExtDict]]:
-        # levels, creators, songs
+    ) -> Dict[str, str]:
+        # builds everything level search needs, except for the page
         if filters is None:
             filters = Filters.setup_empty()
 
         params = (
-            Params()
-            .create_new()
-            .put_definer("search", query)
-            .put_page(page)
-            .put_total(0)
-            .put_filters(filters)
+            Params().create_new().put_definer("search", query).put_total(0).put_filters(filters)
         )
-        codes = {-1: MissingAccess("No levels were found.")}
+
         if filters.strategy == SearchStrategy.BY_USER:
 
             if user_id is None:
@@ -589,7 +707,28 @@ class Session:
         if gauntlet is not None:
             params.put_definer("gauntlet", gauntlet)
 
-        payload = params.finish()
+        return params.finish()
+
+    async def search_levels_on_page(
+        self,
+        page: int = 0,
+        query: str = "",
+        filters: Optional[Filters] = None,
+        user_id: Optional[int] = None,
+        gauntlet: Optional[int] = None,
+        *,
+        template: Optional[Dict[str, str]] = None,
+        raise_errors: bool = True,
+        client: Client,
+    ) -> Tuple[List[ExtDict], List[ExtDict], List[ExtDict]]:
+        # levels, creators, songs
+        if template is None:
+            template = self.get_level_search_template(
+                query=query, filters=filters, user_id=user_id, gauntlet=gauntlet, client=client
+            )
+
+        payload = Params.from_template(template).put_page(page).close()
+        codes = {-1: MissingAccess("No levels were found.")}
 
         resp = await self.http.request(
             Route.LEVEL_SEARCH, payload, raise_errors=raise_errors, error_codes=codes
@@ -598,20 +737,17 @@ class Session:
         if not resp:
             return [], [], []
 
-        resp, parser = resp.split("#"), Parser().with_split("~|~").should_map()
+        lvdata, cdata, sdata = resp.split("#", 3)[:3]
 
-        lvdata, cdata, sdata = resp[:3]
-
-        songs = list(map(parser.parse, filter(is_not_empty, sdata.split("~:~"))))
+        songs = [parse_song_mapping(song) for song in sdata.split("~:~") if song]
 
         creators = [
             ExtDict(zip(("id", "name", "account_id"), creator.split(":")))
-            for creator in filter(is_not_empty, cdata.split("|"))
+            for creator in cdata.split("|")
+            if creator
         ]
 
-        parser.with_split(":").add_ext({"101": 0, "102": -1, "103": -1})
-
-        levels = list(map(parser.parse, filter(is_not_empty, lvdata.split("|"))))
+        levels = [parse_level_mapping(level) for level in lvdata.split("|") if level]
 
         return levels, creators, songs
 
@@ -624,20 +760,21 @@ class Session:
         *,
         client: Client,
     ) -> List[ExtDict]:
+        template = self.get_level_search_template(
+            query=query, filters=filters, user_id=user_id, client=client
+        )
+
         to_run = [
             self.search_levels_on_page(
-                query=query,
-                filters=filters,
-                user_id=user_id,
-                page=page,
-                raise_errors=False,
-                client=client,
+                page=page, template=template, raise_errors=False, client=client
             )
             for page in pages
         ]
         levels, creators, songs = [], [], []
 
-        for (level_part, creator_part, song_part) in await asyncio.gather(*to_run):
+        for result in drop_page_errors(await self.gather_bounded(to_run)):
+            level_part, creator_part, song_part = result
+
             levels.extend(level_part)
             creators.extend(creator_part)
             songs.extend(song_part)
@@ -651,14 +788,7 @@ class Session:
         await self.http.request(Route.REPORT_LEVEL, payload, error_codes=codes)
 
     async def delete_level(self, level_id: int, *, client: Client) -> None:
-        payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_definer("levelid", level_id)
-            .put_password(client.encodedpass)
-            .finish_level()
-        )
+        payload = self.account_params(client).put_definer("levelid", level_id).finish_level()
 
         resp = await self.http.request(Route.DELETE_LEVEL, payload)
 
@@ -667,10 +797,7 @@ class Session:
 
     async def update_level_desc(self, level_id: int, content: str, *, client: Client) -> None:
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
+            self.account_params(client)
             .put_definer("levelid", level_id)
             .put_level_desc(content)
             .finish()
@@ -689,11 +816,8 @@ class Session:
         chk = Coder.gen_chk(type="like_rate", values=values)
 
         payload = (
-            Params()
-            .create_new()
+            self.account_params(client)
             .put_definer("levelid", level_id)
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
             .put_udid(udid)
             .put_uuid(uuid)
             .put_definer("stars", rating)
@@ -713,10 +837,7 @@ class Session:
         rating_level = demon_rating.value
 
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
+            self.account_params(client)
             .put_definer("levelid", level_id)
             .put_definer("rating", rating_level)
             .put_mode(int(mod))
@@ -736,10 +857,7 @@ class Session:
         self, level_id: int, rating: int, featured: bool, *, client: Client
     ) -> None:
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
+            self.account_params(client)
             .put_definer("levelid", level_id)
             .put_definer("stars", rating)
             .put_feature(int(featured))
@@ -764,10 +882,7 @@ class Session:
         chk = Coder.gen_chk(type="like_rate", values=values)
 
         payload = (
-            Params()
-            .create_new(game_version=20)
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
+            self.account_params(client, game_version=20)
             .put_udid(udid)
             .put_uuid(uuid)
             .put_definer("itemid", item_id)
@@ -790,28 +905,18 @@ class Session:
         assert sent_or_inbox in ("inbox", "sent")
         inbox = 0 if sent_or_inbox != "sent" else 1
 
-        payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
-            .put_page(page)
-            .put_total(0)
-            .get_sent(inbox)
-            .finish()
-        )
+        payload = self.account_params(client).put_total(0).get_sent(inbox).put_page(page).finish()
         codes = {-1: MissingAccess("Failed to get messages."), -2: NothingFound("gd.Message")}
 
         resp = await self.http.request(
             Route.GET_PRIVATE_MESSAGES, payload, error_codes=codes, raise_errors=raise_errors
         )
-        resp = Parser().split("#").take(0).check_empty().split("|").parse(resp)
+        resp = parse_page_rows(resp)
 
         if resp is None:
             return list()
 
-        parser = Parser().with_split(":").should_map()
-        return list(map(parser.parse, resp))
+        return [parse_colon_mapping(message) for message in resp]
 
     async def get_messages(
         self, sent_or_inbox: str, pages: Optional[Sequence[int]] = None, *, client: Client
@@ -831,11 +936,8 @@ class Session:
         to_gen = [client.name, 0, 0, 1]
 
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
+            self.account_params(client)
             .put_username(client.name)
-            .put_password(client.encodedpass)
             .put_comment(content, to_gen)
             .comment_for("profile")
             .finish()
@@ -854,11 +956,8 @@ class Session:
         to_gen = [client.name, level_id, percentage, 0]
 
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
+            self.account_params(client)
             .put_username(client.name)
-            .put_password(client.encodedpass)
             .put_comment(content, to_gen)
             .comment_for("level", level_id)
             .put_percent(percentage)
@@ -874,11 +973,8 @@ class Session:
         cases = {0: Route.DELETE_LEVEL_COMMENT, 1: Route.DELETE_ACC_COMMENT}
         route = cases.get(typeof.value)
         payload = (
-            Params()
-            .create_new()
+            self.account_params(client)
             .put_definer("commentid", comment_id)
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
             .comment_for(typeof.name.lower(), level_id)
             .finish()
         )
@@ -891,13 +987,7 @@ class Session:
         self, target_id: int, message: str = "", *, client: Client
     ) -> None:
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_recipient(target_id)
-            .put_fr_comment(message)
-            .put_password(client.encodedpass)
-            .finish()
+            self.account_params(client).put_recipient(target_id).put_fr_comment(message).finish()
         )
         resp = await self.http.request(Route.SEND_REQUEST, payload)
 
@@ -911,12 +1001,9 @@ class Session:
         self, typeof: MessageOrRequestType, user_id: int, client: Client
     ) -> None:
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
+            self.account_params(client)
             .put_definer("user", user_id)
-            .put_password(client.encodedpass)
-            .put_is_sender(typeof.name.lower())
+            .put_is_sender(MESSAGE_TYPE_NAMES[typeof])
             .finish()
         )
         resp = await self.http.request(Route.DELETE_REQUEST, payload)
@@ -934,10 +1021,7 @@ class Session:
                 "Failed to accept a friend request. Reason: request is sent, not recieved one."
             )
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
+            self.account_params(client)
             .put_definer("user", user_id)
             .put_definer("requestid", request_id)
             .finish()
@@ -948,14 +1032,7 @@ class Session:
             raise MissingAccess(f"Failed to accept a friend request by ID: {request_id!r}.")
 
     async def read_friend_req(self, request_id: int, client: Client) -> None:
-        payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
-            .put_definer("requestid", request_id)
-            .finish()
-        )
+        payload = self.account_params(client).put_definer("requestid", request_id).finish()
         resp = await self.http.request(Route.READ_REQUEST, payload)
 
         if resp != 1:
@@ -965,17 +1042,14 @@ class Session:
         self, typeof: MessageOrRequestType, message_id: int, client: Client
     ) -> str:
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
+            self.account_params(client)
             .put_definer("messageid", message_id)
-            .put_is_sender(typeof.name.lower())
-            .put_password(client.encodedpass)
+            .put_is_sender(MESSAGE_TYPE_NAMES[typeof])
             .finish()
         )
         codes = {-1: MissingAccess(f"Failed to read a message by ID: {message_id!r}.")}
         resp = await self.http.request(Route.READ_PRIVATE_MESSAGE, payload, error_codes=codes,)
-        mapped = Parser().with_split(":").should_map().parse(resp)
+        mapped = parse_colon_mapping(resp)
 
         return Coder.decode(type="message", string=mapped.get(Index.MESSAGE_BODY, ""))
 
@@ -983,12 +1057,9 @@ class Session:
         self, typeof: MessageOrRequestType, message_id: int, client: Client
     ) -> None:
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
+            self.account_params(client)
             .put_definer("messageid", message_id)
-            .put_password(client.encodedpass)
-            .put_is_sender(typeof.name.lower())
+            .put_is_sender(MESSAGE_TYPE_NAMES[typeof])
             .finish()
         )
         resp = await self.http.request(Route.DELETE_PRIVATE_MESSAGE, payload)
@@ -1001,10 +1072,9 @@ class Session:
 
         resp = await self.http.request(Route.GET_GAUNTLETS, payload)
 
-        splitted = Parser().split("#").take(0).split("|").parse(resp)
-        parser = Parser().with_split(":").should_map()
+        splitted = resp.split("#", 1)[0].split("|")
 
-        return list(map(parser.parse, filter(is_not_empty, splitted)))
+        return [parse_colon_mapping(gauntlet) for gauntlet in splitted if gauntlet]
 
     async def get_page_map_packs(
         self, page: int = 0, *, raise_errors: bool = True
@@ -1013,41 +1083,24 @@ class Session:
 
         resp = await self.http.request(Route.GET_MAP_PACKS, payload)
 
-        splitted = Parser().split("#").take(0).split("|").check_empty().should_map().parse(resp)
+        splitted = parse_page_rows(resp)
 
         if not splitted:
             if raise_errors:
                 raise NothingFound("gd.MapPack")
             return list()
 
-        parser = Parser().with_split(":").should_map()
-
-        return list(map(parser.parse, splitted))
+        return [parse_colon_mapping(pack) for pack in splitted]
 
     async def get_map_packs(self, pages: Sequence[int]) -> List[ExtDict]:
         to_run = [self.get_page_map_packs(page=page, raise_errors=False) for page in pages]
         return await self.run_many(to_run)
 
     async def get_page_friend_requests(
-        self,
-        sent_or_inbox: str = "inbox",
-        page: int = 0,
-        *,
-        raise_errors: bool = True,
-        client: Client,
+        self, inbox: int = 0, page: int = 0, *, raise_errors: bool = True, client: Client
     ) -> List[ExtDict]:
-        inbox = int(sent_or_inbox == "sent")
-
-        payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", str(client.account_id))
-            .put_password(client.encodedpass)
-            .put_page(page)
-            .put_total(0)
-            .get_sent(inbox)
-            .finish()
-        )
+        # "inbox" is 1 for sent requests and 0 for incoming ones
+        payload = self.account_params(client).put_page(page).put_total(0).get_sent(inbox).finish()
         codes = {
             -1: MissingAccess(f"Failed to get friend requests on page {page}."),
             -2: NothingFound("gd.FriendRequest"),
@@ -1056,24 +1109,27 @@ class Session:
         resp = await self.http.request(
             Route.GET_FRIEND_REQUESTS, payload, error_codes=codes, raise_errors=raise_errors
         )
-        splitted = Parser().split("#").take(0).split("|").check_empty().parse(resp)
+        splitted = parse_page_rows(resp)
 
-        if resp is None:
+        if splitted is None:
             return list()
 
-        parser = Parser().split(":").add_ext({"101": inbox}).should_map()
+        requests = [parse_colon_mapping(request) for request in splitted]
+
+        for request in requests:
+            request["101"] = inbox
 
-        return list(map(parser.parse, splitted))
+        return requests
 
     async def get_friend_requests(
         self, pages: Sequence[int], sent_or_inbox: str = "inbox", *, client: Client
     ) -> List[ExtDict]:
         assert sent_or_inbox in ("sent", "inbox")
 
+        inbox = int(sent_or_inbox == "sent")
+
         to_run = [
-            self.get_page_friend_requests(
-                sent_or_inbox=sent_or_inbox, page=page, raise_errors=False, client=client
-            )
+            self.get_page_friend_requests(inbox=inbox, page=page, raise_errors=False, client=client)
             for page in pages
         ]
 
@@ -1089,23 +1145,12 @@ class Session:
         raise_errors: bool = True,
         strategy: CommentStrategy,
     ) -> List[ExtDict]:
-        assert isinstance(page, int) and page >= 0
-        assert type in ("profile", "level")
-
         is_level = type == "level"
 
-        typeid = is_level ^ 1
         definer = "userid" if is_level else "accountid"
         selfid = id if is_level else account_id
         route = Route.GET_COMMENT_HISTORY if is_level else Route.GET_ACC_COMMENTS
 
-        parser = Parser().add_ext({"101": typeid}).should_map()
-
-        if is_level:
-            parser.split(":").take(0).split("~")
-        else:
-            parser.with_split("~")
-
         param_obj = Params().create_new().put_definer(definer, selfid).put_page(page).put_total(0)
         if is_level:
             param_obj.put_mode(strategy.value)
@@ -1120,14 +1165,16 @@ class Session:
         if not resp:
             return list()
 
-        splitted = resp.split("#").pop(0)
+        splitted = resp.split("#", 1)[0]
 
         if not splitted:
             if raise_errors:
                 raise NothingFound("gd.Comment")
             return list()
 
-        return list(map(parser.parse, filter(is_not_empty, splitted.split("|"))))
+        parse = parse_comment_history if is_level else parse_profile_comment
+
+        return [parse(comment) for comment in splitted.split("|") if comment]
 
     async def retrieve_comments(
         self,
@@ -1175,19 +1222,21 @@ class Session:
 
         resp = await self.http.request(Route.GET_COMMENTS, payload, error_codes=codes)
 
-        splitted = Parser().split("#").take(0).split("|").parse(resp)
-        parser = Parser().with_split("~").should_map()
+        rows = [elem.split(":") for elem in resp.split("#", 1)[0].split("|") if elem]
 
         res = []
 
-        for elem in filter(is_not_empty, splitted):
-            com_data, user_data, *_ = map(parser.parse, elem.split(":"))
-            com_data.update({"1": level_id, "101": 0, "102": 0})
+        for com_part, user_part, *_ in rows:
+            com_data = parse_tilde_mapping(com_part)
+            com_data["1"] = level_id
+            com_data["101"] = com_data["102"] = 0
+
+            user_info = parse_tilde_mapping(user_part)
 
             user_data = ExtDict(
-                account_id=user_data.getcast(Index.USER_ACCOUNT_ID, 0, int),
+                account_id=user_info.getcast(Index.USER_ACCOUNT_ID, 0, int),
                 id=com_data.getcast(Index.COMMENT_AUTHOR_ID, 0, int),
-                name=user_data.get(Index.USER_NAME, "unknown"),
+                name=user_info.get(Index.USER_NAME, "unknown"),
             )
 
             res.append((com_data, user_data))
@@ -1196,30 +1245,18 @@ class Session:
 
     async def block_user(self, account_id: int, unblock: bool = False, *, client: Client) -> None:
         route = Route.UNBLOCK_USER if unblock else Route.BLOCK_USER
-        payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
-            .put_definer("user", account_id)
-            .finish()
-        )
+        payload = self.account_params(client).put_definer("user", account_id).finish()
         resp = await self.http.request(route, payload)
 
+        self.forget_user_info(client.account_id, account_id)
+
         if resp != 1:
             raise MissingAccess(
                 f"Failed to {'un' if unblock else ''}block a user by Account ID: {account_id!r}."
             )
 
     async def unfriend_user(self, account_id: int, *, client: Client) -> None:
-        payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
-            .put_definer("user", account_id)
-            .finish()
-        )
+        payload = self.account_params(client).put_definer("user", account_id).finish()
         resp = await self.http.request(Route.REMOVE_FRIEND, payload)
 
         if resp != 1:
@@ -1229,12 +1266,9 @@ class Session:
         self, account_id: int, subject: str, body: str, *, client: Client
     ) -> None:
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
+            self.account_params(client)
             .put_message(subject, body)
             .put_recipient(account_id)
-            .put_password(client.encodedpass)
             .finish()
         )
         resp = await self.http.request(Route.SEND_PRIVATE_MESSAGE, payload)
@@ -1245,40 +1279,24 @@ class Session:
             )
 
     async def update_profile(self, settings: Dict[str, int], *, client: Client) -> None:
-        settings_cased = {Converter.snake_to_camel(name): value for name, value in settings.items()}
+        settings_cased = {
+            (PROFILE_SETTING_NAMES.get(name) or Converter.snake_to_camel(name)): value
+            for name, value in settings.items()
+        }
 
         rs = Coder.gen_rs()
 
-        req_chk_params = [client.account_id]
-        req_chk_params.extend(
-            settings.get(param, 0)
-            for param in (
-                "user_coins",
-                "demons",
-                "stars",
-                "coins",
-                "icon_type",
-                "icon",
-                "diamonds",
-                "acc_icon",
-                "acc_ship",
-                "acc_ball",
-                "acc_bird",
-                "acc_dart",
-                "acc_robot",
-                "acc_glow",
-                "acc_spider",
-                "acc_explosion",
-            )
-        )
+        try:
+            req_chk_params = [client.account_id, *get_profile_chk_values(settings)]
+
+        except KeyError:  # some settings are missing, which means they are not set (0)
+            req_chk_params = [client.account_id]
+            req_chk_params.extend(settings.get(param, 0) for param in PROFILE_CHK_KEYS)
 
         chk = Coder.gen_chk(type="userscore", values=req_chk_params)
 
         payload = (
-            Params()
-            .create_new()
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
+            self.account_params(client)
             .put_username(client.name)
             .put_seed(rs)
             .put_seed(chk, suffix=str(2))
@@ -1289,13 +1307,47 @@ class Session:
 
         resp = await self.http.request(Route.UPDATE_USER_SCORE, payload)
 
+        self.forget_user_info(client.account_id)
+
         if not resp > 0:
             raise MissingAccess(f"Failed to update profile of a client: {client!r}")
 
     async def generate_icon(
         self, form: str, id: int, color_1: int, color_2: int, has_glow: bool, size: int
     ) -> bytes:
-        # fetch an icon from gdbrowser site
+        # fetch an icon from gdbrowser site, icons are the same for the same arguments
+        key = (form, id, color_1, color_2, bool(has_glow), size)
+        icon = self.icon_cache.get(key)
+
+        if icon is not None:
+            return icon
+
+        # concurrent requests for the same icon wait for the first one instead of fetching again
+        lock = self.icon_locks.setdefault(key, asyncio.Lock())
+
+        try:
+            async with lock:
+                icon = self.icon_cache.get(key)
+
+                if icon is None:
+                    icon, status = await self.fetch_icon(form, id, color_1, color_2, has_glow, size)
+
+                    # error responses (like 429 or 5xx) should not be served again
+                    if status == 200:
+                        if len(self.icon_cache) >= ICON_CACHE_SIZE:
+                            del self.icon_cache[next(iter(self.icon_cache))]
+
+                        self.icon_cache[key] = icon
+
+        finally:
+            if self.icon_locks.get(key) is lock:
+                del self.icon_locks[key]
+
+        return icon
+
+    async def fetch_icon(
+        self, form: str, id: int, color_1: int, color_2: int, has_glow: bool, size: int
+    ) -> Tuple[bytes, int]:
         query = {
             "form": form,
             "icon": id,
@@ -1308,7 +1360,9 @@ class Session:
         endpoint = "https://gdbrowser.com/icon/icon"
         method = "GET"
 
-        return await self.http.normal_request(url=endpoint, params=query, method=method)
+        return await self.http.normal_request(
+            url=endpoint, params=query, method=method, get_status=True
+        )
 
     async def generate_icons(
         self, icon_map: Dict[str, int], color_1: int, color_2: int, has_glow: bool, size: int
@@ -1334,36 +1388,67 @@ class Session:
         client: Client,
     ) -> None:
         payload = (
-            Params()
-            .create_new("web")
-            .put_definer("accountid", client.account_id)
-            .put_password(client.encodedpass)
+            self.account_params(client, "web")
             .put_profile_upd(msg, friend_req, comments, youtube, twitter, twitch)
             .finish_login()
         )
         resp = await self.http.request(Route.UPDATE_ACC_SETTINGS, payload)
 
+        self.forget_user_info(client.account_id)
+
         if resp != 1:
             raise MissingAccess(f"Failed to update profile settings of a client: {client!r}.")
 
+    async def gather_bounded(
+        self, tasks: Iterable[Awaitable], limit: Optional[int] = None
+    ) -> List[Any]:
+        # run tasks concurrently, but with no more than "limit" of them at a time.
+        # exceptions are returned instead of being raised, so that one failing
+        # task does not cancel all others.
+        if limit is None:
+            limit = self.max_concurrency
+
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(task: Awaitable) -> Any:
+            async with semaphore:
+                return await task
+
+        return await asyncio.gather(*map(run, tasks), return_exceptions=True)
+
     async def run_many(self, tasks: List[asyncio.Task]) -> Any:
-        res = await asyncio.gather(*tasks)
+        if not tasks:
+            return []
 
-        res = [elem for elem in res if elem]
+        if len(tasks) == 1:  # no need to gather a single task
+            try:
+                res = [await tasks[0]]
+            except PAGE_ERRORS as error:
+                res = [error]
 
-        if all(iterable(elem) for elem in res):
+        else:
+            res = await self.gather_bounded(tasks)
+
+        res = [elem for elem in drop_page_errors(res) if elem]
+
+        if all(isinstance(elem, list) for elem in res):
             res = list(chain.from_iterable(res))
 
         return res
 
 
-def iterable(maybe_iterable: Iterable) -> bool:
-    try:
-        iter(maybe_iterable)
-        return True
-    except Exception:
-        return False
+def drop_page_errors(results: Iterable[Any]) -> List[Any]:
+    # expected page errors are dropped, while any other exception is raised
+    kept = []
 
+    for result in results:
+        if isinstance(result, PAGE_ERRORS):
+            log.debug("Dropping failed page: %r", result)
+
+        elif isinstance(result, BaseException):
+            raise result
+
+        else:
+            kept.append(result)
 
-def is_not_empty(sequence: Sequence) -> bool:
-    return bool(len(sequence))
+    return kept
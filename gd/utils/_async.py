@@ -25,6 +25,7 @@ from ..typing import (
     Type,
     Union,
 )
+from .http_request import close_sessions
 
 __all__ = (
     "run_blocking_io",
@@ -252,6 +253,8 @@ def shutdown_loop(loop: asyncio.AbstractEventLoop) -> None:
         return
 
     try:
+        # sessions are closed first, while the loop can still complete closing connections
+        loop.run_until_complete(close_sessions(loop))
         loop.stop()
         cancel_all_tasks(loop)
         loop.run_until_complete(loop.shutdown_asyncgens())
@@ -1,3 +1,4 @@
+import functools
 import re
 
 from .enums import DemonDifficulty, LevelDifficulty, GauntletEnum
@@ -77,6 +78,7 @@ class Converter:
             return str(n) + cases.get(x % 10, "th")
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def snake_to_camel(string: str) -> str:  # not perfect but still...
         return re.sub("_([a-zA-Z0-9])", lambda match: match.group(1).upper(), string)
 
@@ -8,7 +8,9 @@ import zlib
 # absolute import because we are deep
 from gd.typing import List, Union
 
-from .xor_cipher import XORCipher as XOR
+from .xor_cipher import XORCipher as XOR, xor_bytes
+
+RS_CHARACTERS = string.ascii_letters + string.digits
 
 
 class Coder:
@@ -37,7 +39,11 @@ class Coder:
 
     @staticmethod
     def normal_xor(string: str, key: int) -> str:
-        return "".join(chr(ord(char) ^ key) for char in string)
+        try:
+            return xor_bytes(string.encode("latin-1"), bytes((key,))).decode("latin-1")
+
+        except (UnicodeEncodeError, ValueError):  # either string or key do not fit into bytes
+            return "".join(chr(ord(char) ^ key) for char in string)
 
     @classmethod
     def decode_save(cls, save: str, needs_xor: bool = True) -> str:
@@ -95,8 +101,7 @@ class Coder:
         :class:`str`
             Generated string.
         """
-        sset = string.ascii_letters + string.digits
-        return "".join(random.choice(sset) for _ in range(length))
+        return "".join(random.choices(RS_CHARACTERS, k=length))
 
     @classmethod
     def encode(cls, type: str, string: str) -> str:
@@ -239,7 +244,7 @@ class Coder:
 
         space = len(data_string) // chars_required
 
-        return data_string[::space][:chars_required]
+        return data_string[: space * chars_required : space]
 
     @classmethod
     def gen_level_lb_seed(
@@ -1,5 +1,18 @@
 from itertools import cycle
 
+__all__ = ("XORCipher", "xor_bytes")
+
+
+def xor_bytes(data: bytes, key: bytes) -> bytes:
+    # XOR data with repeated key, using (C-level) integer operations instead of a byte loop
+    if not key:
+        return b""
+
+    size = len(data)
+    key = (key * (size // len(key) + 1))[:size]
+
+    return (int.from_bytes(data, "little") ^ int.from_bytes(key, "little")).to_bytes(size, "little")
+
 
 class XORCipher:
     @staticmethod
@@ -27,4 +40,8 @@ class XORCipher:
         :class:`str`
             A string after XOR operation.
         """
-        return ("").join(chr(ord(x) ^ ord(y)) for x, y in zip(string, cycle(key)))
+        try:
+            return xor_bytes(string.encode("latin-1"), key.encode("latin-1")).decode("latin-1")
+
+        except UnicodeEncodeError:  # some characters do not fit into a byte
+            return ("").join(chr(ord(x) ^ ord(y)) for x, y in zip(string, cycle(key)))
@@ -1,4 +1,6 @@
 import asyncio
+import atexit
+import functools
 import platform
 
 from yarl import URL
@@ -6,7 +8,7 @@ import aiohttp
 
 import gd
 
-from ..typing import Any, Dict, List, Optional, Union
+from ..typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from ..logging import get_logger
 from ..errors import HTTPError
 from .text_tools import make_repr
@@ -16,6 +18,75 @@ log = get_logger(__name__)
 BASE = "http://www.boomlings.com/database/"
 VALID_ERRORS = (OSError, aiohttp.ClientError)
 
+# shared sessions that are not closed yet, mapped to (loop, closer) pairs; see close_on_shutdown()
+session_closers = {}
+
+
+@functools.lru_cache(maxsize=256)
+def make_url(base: Union[str, URL], php: str) -> URL:
+    # routes and bases are a small fixed set, so built URLs are cached
+    return URL(base) / (php + ".php")
+
+
+async def close_on_shutdown(session: aiohttp.ClientSession) -> AsyncIterator[None]:
+    # event loops finalize async generators when shutting down (see loop.shutdown_asyncgens()),
+    # which is done by asyncio.run() and alike; this is used to close the session
+    # while its loop is still alive. the generator is started once and never resumed otherwise.
+    try:
+        yield
+
+    finally:
+        session_closers.pop(session, None)
+
+        if not session.closed:
+            try:
+                await session.close()
+
+            except Exception as error:  # noqa
+                log.warning("Error while closing HTTP session: %s", error)
+
+
+def drop_session(session: aiohttp.ClientSession) -> None:
+    # the loop of the session is closed, so nothing can be awaited in it anymore;
+    # detach the connector and drop its connections synchronously instead.
+    session_closers.pop(session, None)
+
+    connector = session.connector
+    session.detach()
+
+    if connector is not None:
+        connector._close()
+
+
+async def close_sessions(loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """|coro|
+
+    Close all shared sessions that are bound to ``loop``.
+
+    If ``loop`` is ``None`` or omitted, the current event loop is used.
+    """
+    if loop is None:
+        loop = asyncio.get_event_loop()
+
+    for session_loop, closer in list(session_closers.values()):
+        if session_loop is loop:
+            await closer.aclose()
+
+
+@atexit.register
+def close_remaining_sessions() -> None:
+    # sessions whose loops were never shut down (e.g. Client.loop) are closed on exit
+    for session, (loop, closer) in list(session_closers.items()):
+        if loop.is_closed():
+            drop_session(session)
+
+        elif not loop.is_running():
+            try:
+                loop.run_until_complete(closer.aclose())
+
+            except Exception as error:  # noqa
+                log.warning("Error while closing HTTP session on exit: %s", error)
+
 
 class HTTPClient:
     """Class that handles the main part of the entire gd.py - sending HTTP requests."""
@@ -36,6 +107,8 @@ class HTTPClient:
         self.timeout = timeout
         self.debug = debug
         self.last_result = None  # for testing
+        self.session = None
+        self.session_loop = None
 
     def __repr__(self) -> str:
         info = {
@@ -68,6 +141,87 @@ class HTTPClient:
     def make_timeout(self) -> aiohttp.ClientTimeout:
         return aiohttp.ClientTimeout(total=self.timeout)
 
+    def make_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=100, limit_per_host=30, keepalive_timeout=75, ttl_dns_cache=300
+        )
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """|coro|
+
+        Get :class:`aiohttp.ClientSession` that is shared between requests,
+        so connections are kept alive and reused.
+
+        The session is lazily created, and is recreated if it was closed
+        or if the event loop it was bound to has changed.
+
+        Returns
+        -------
+        :class:`aiohttp.ClientSession`
+            Session to send requests with.
+        """
+        loop = asyncio.get_event_loop()
+
+        if self.session is not None and (self.session.closed or self.session_loop is not loop):
+            self.detach_session()
+
+        if self.session is None:
+            session = aiohttp.ClientSession(
+                connector=self.make_connector(),
+                headers={"Connection": "keep-alive"},
+                timeout=self.make_timeout(),
+                # requests are stateless, cookies are passed explicitly when needed
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+
+            closer = close_on_shutdown(session)
+            await closer.asend(None)  # start the generator, registering it in the loop
+
+            session_closers[session] = (loop, closer)
+
+            self.session, self.session_loop = session, loop
+
+        return self.session
+
+    def detach_session(self) -> None:
+        """Forget the shared session, without awaiting anything.
+
+        A session of a closed loop has its connections dropped. A session of a loop
+        that is still alive is closed when that loop shuts down.
+        """
+        session, loop = self.session, self.session_loop
+        self.session = self.session_loop = None
+
+        if session is not None and not session.closed and loop.is_closed():
+            drop_session(session)
+
+    async def close(self) -> None:
+        """|coro|
+
+        Close the shared session, if it was created.
+
+        If the session belongs to another event loop, it is detached instead.
+        See :meth:`.HTTPClient.detach_session`.
+        """
+        session, loop = self.session, self.session_loop
+
+        if session is None:
+            return
+
+        if loop is not asyncio.get_event_loop():
+            self.detach_session()
+            return
+
+        self.session = self.session_loop = None
+
+        _, closer = session_closers.get(session, (None, None))
+
+        if closer is not None:
+            await closer.aclose()
+
+        elif not session.closed:
+            await session.close()
+
     def change_url(self, url: Union[str, URL]) -> None:
         """Change base for requests.
         Default base is ``http://www.boomlings.com/database/``,
@@ -158,38 +312,41 @@ class HTTPClient:
         :exc:`.HTTPError`
             An exception occured during handling request/response.
         """
-        base = self.url if custom_base is None else URL(custom_base)
-        url = base / (php + ".php")
+        url = make_url(self.url if custom_base is None else custom_base, php)
 
         if method is None:
             method = "get" if params is None else "post"
 
         method = str(method).upper()
 
-        headers = None
+        headers = self.make_headers()
 
         if cookie is not None:
-            headers = {"Cookie": cookie}
+            headers["Cookie"] = cookie
 
         if self.debug:
             for name, value in {"URL": url, "Data": data, "Params": params}.items():
                 log.debug(f"{name}: {value}")
 
-        async with self.semaphore, aiohttp.ClientSession(
-            headers=self.make_headers(),
-            skip_auto_headers=self.get_skip_headers(),
-            timeout=self.make_timeout(),
-            raise_for_status=True,
-        ) as client:
+        async with self.semaphore:
+            client = await self.get_session()
+
             try:
-                resp = await client.request(
-                    method=method, url=url, data=data, params=params, headers=headers
-                )
+                async with client.request(
+                    method=method,
+                    url=url,
+                    data=data,
+                    params=params,
+                    headers=headers,
+                    skip_auto_headers=self.get_skip_headers(),
+                    timeout=self.make_timeout(),
+                ) as resp:
+                    resp.raise_for_status()
+                    data = await resp.content.read()
+
             except VALID_ERRORS as exc:
                 raise HTTPError(exc) from None
 
-            data = await resp.content.read()
-
             if self.debug:
                 log.debug(f"Headers: {dict(resp.request_info.headers)!r}")
                 self.last_result = data.decode(errors="replace")
@@ -291,11 +448,20 @@ class HTTPClient:
         data: Optional[Union[dict, str]] = None,
         params: Optional[Union[dict, str]] = None,
         method: Optional[str] = None,
+        *,
+        new_session: bool = False,
+        get_status: bool = False,
         **kwargs,
-    ) -> bytes:
+    ) -> Union[bytes, Tuple[bytes, int]]:
         """|coro|
         Same as doing :meth:`aiohttp.ClientSession.request`, where ``method`` is
         either given one or ``"GET"`` if ``data`` is None or omitted, and ``"POST"`` otherwise.
+
+        The shared session is used, unless ``new_session`` is ``True``, in which case
+        a one-shot session (and therefore a new connection) is created for the request.
+
+        If ``get_status`` is ``True``, returns a pair (``data``, ``status``),
+        where ``status`` is an :class:`int` HTTP status of the response.
         """
         if method is None:
             method = "GET" if data is None else "POST"
@@ -304,23 +470,39 @@ class HTTPClient:
         if params is None:
             params = {}
 
-        async with aiohttp.ClientSession(timeout=self.make_timeout()) as client:
-            try:
-                resp = await client.request(
-                    method=method, url=url, data=data, params=params, **kwargs
-                )
+        if new_session:
+            client = aiohttp.ClientSession(timeout=self.make_timeout())
+        else:
+            client = await self.get_session()
+
+        try:
+            async with client.request(
+                method=method,
+                url=url,
+                data=data,
+                params=params,
+                timeout=self.make_timeout(),
+                **kwargs,
+            ) as resp:
                 data = await resp.content.read()
 
-            except VALID_ERRORS as exc:
-                raise HTTPError(exc) from None
+        except VALID_ERRORS as exc:
+            raise HTTPError(exc) from None
 
-            if self.debug:
-                for name, value in {
-                    "URL": url,
-                    "Data": data,
-                    "Params": params,
-                    "Headers": dict(resp.request_info.headers),
-                }.items():
-                    log.debug(f"{name}: {value}")
+        finally:
+            if new_session:
+                await client.close()
+
+        if self.debug:
+            for name, value in {
+                "URL": url,
+                "Data": data,
+                "Params": params,
+                "Headers": dict(resp.request_info.headers),
+            }.items():
+                log.debug(f"{name}: {value}")
+
+        if get_status:
+            return data, resp.status
 
         return data
@@ -1,7 +1,7 @@
 """This module is used for Newgrounds parsing."""
 
 from collections import namedtuple
-from itertools import chain
+from itertools import chain, takewhile
 import re
 
 from yarl import URL
@@ -35,12 +35,18 @@ __all__ = (
 T = TypeVar("T")
 U = TypeVar("U")
 
-re_link, re_size, re_name, re_author = (
-    r'https://audio\.ngfiles\.com/([^\'"]+)',
-    r".filesize.:(\d+)",
-    r"<title>([^<>]+)</title>",
-    r'.artist.:.([^\'"]+).',
+re_link, re_size, re_name, re_author = map(
+    re.compile,
+    (
+        r'https://audio\.ngfiles\.com/([^\'"]+)',
+        r".filesize.:(\d+)",
+        r"<title>([^<>]+)</title>",
+        r'.artist.:.([^\'"]+).',
+    ),
 )
+link_start = "https://audio.ngfiles.com/"
+escaped_link_start = link_start.replace("/", "\\/")  # embedded JSON escapes slashes
+
 SongInfo = namedtuple("SongInfo", "link size name author")
 
 
@@ -51,14 +57,66 @@ def html_parse(text: str) -> Element:
         return parse(text, "etree", False)
 
 
+def cut_between(text: str, start: str, end: str) -> str:
+    _, found, rest = text.partition(start)
+
+    if not found:
+        raise ValueError(f"Failed to find {start!r} in given text.")
+
+    return rest.partition(end)[0]
+
+
+def unescape(string: str) -> str:
+    return string.replace("\\", "")
+
+
+def cut_digits(text: str, start: str) -> str:
+    _, found, rest = text.partition(start)
+
+    if not found:
+        raise ValueError(f"Failed to find {start!r} in given text.")
+
+    return "".join(takewhile(str.isdigit, rest))
+
+
+def find_link(text: str) -> str:
+    # links are usually embedded in JSON with escaped slashes, but can be plain as well
+    try:
+        return link_start + unescape(cut_between(text, escaped_link_start, '"'))
+    except ValueError:
+        return link_start + re_link.search(text).group(1)
+
+
+def cut_song_info(text: str) -> SongInfo:
+    # only the extracted fields are unescaped, not the entire page
+    return SongInfo(
+        link=find_link(text),
+        size=int(cut_digits(text, '"filesize":')),
+        name=unescape(cut_between(text, "<title>", "</title>")),
+        author=unescape(cut_between(text, '"artist":"', '"')),
+    )
+
+
+def search_song_info(text: str) -> SongInfo:
+    # slower, but handles escaped JSON: unescape the entire page and search for each field
+    text = unescape(text)
+
+    return SongInfo(
+        link=re_link.search(text).group(0),
+        size=int(re_size.search(text).group(1)),
+        name=re_name.search(text).group(1),
+        author=re_author.search(text).group(1),
+    )
+
+
 def find_song_info(text: str) -> SongInfo:
     try:
-        return SongInfo(
-            link=re.search(re_link, text).group(0),
-            size=int(re.search(re_size, text).group(1)),
-            name=re.search(re_name, text).group(1),
-            author=re.search(re_author, text).group(1),
-        )
+        return cut_song_info(text)
+    except (AttributeError, ValueError):
+        pass
+
+    try:
+        return search_song_info(text)
     except AttributeError:  # not found
         raise ValueError("Song info was not found.") from None
 
@@ -88,6 +88,26 @@ class Parameters:
 
         return self
 
+    @classmethod
+    def from_template(cls, template: Dict[str, str]) -> Parameters:
+        """Start forming a new dictionary, based on a copy of ``template``.
+
+        This allows building parameters that do not change between requests only once.
+
+        Parameters
+        ----------
+        template: Dict[:class:`str`, :class:`str`]
+            Parameters to start with, e.g. ones returned by :meth:`.Parameters.finish`.
+
+        Returns
+        -------
+        :class:`.Parameters`
+            New parameters object.
+        """
+        self = cls()
+        self.dict = template.copy()
+        return self
+
     def finish(self) -> Dict[str, str]:
         """Finishes creating parameters dictionary, and adds ``secret`` parameter.
 
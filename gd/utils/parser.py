@@ -23,6 +23,13 @@ def action_split(delim: str) -> Callable[[str], List[str]]:
     return split
 
 
+def action_split_first(delim: str) -> Callable[[str], str]:
+    def split_first(string: str) -> str:
+        return string.split(delim, 1)[0]
+
+    return split_first
+
+
 def action_take(key: Any) -> Callable[[Sequence[Any]], Any]:
     def take(x: Any) -> Any:
         return x[key]
@@ -70,6 +77,7 @@ class Parser:
         self.need_map = False
         self.actions = list()
         self.ext = {}
+        self.last_split = None
 
     @staticmethod
     def map(item: Iterable[Any]) -> Dict[Any, Any]:
@@ -81,14 +89,22 @@ class Parser:
 
     def split(self, delim: str) -> Parser:
         self.actions.append(action_split(delim))
+        self.last_split = delim
         return self
 
     def take(self, key: Any) -> Parser:
-        self.actions.append(action_take(key))
+        if key == 0 and self.last_split is not None:
+            # only the first part is needed, so there is no reason to split the whole string
+            self.actions[-1] = action_split_first(self.last_split)
+        else:
+            self.actions.append(action_take(key))
+
+        self.last_split = None
         return self
 
     def check_empty(self) -> Parser:
         self.actions.append(action_not_empty())
+        self.last_split = None
         return self
 
     def add_ext(self, ext: Dict[Any, Any]) -> Parser:
@@ -111,6 +127,35 @@ class Parser:
         except Exception:  # noqa
             return
 
+    def compile(self) -> Callable[[str], Any]:
+        # bake current state into a plain function, which does exactly what parse() does.
+        # changing the parser afterwards does not affect the compiled function.
+        split_f, actions, need_map, ext, map = (
+            self.split_f,
+            tuple(self.actions),
+            self.need_map,
+            self.ext.copy(),
+            self.map,
+        )
+
+        def parse(string: str) -> Any:
+            try:
+                res = split_f(string)
+
+                for action in actions:
+                    res = action(res)
+
+                if need_map:
+                    res = map(res)
+                    res.update(ext)
+
+                return res
+
+            except Exception:  # noqa
+                return
+
+        return parse
+
     def should_map(self) -> Parser:
         self.need_map = True
         return self
@@ -12,17 +12,17 @@ class SaveParser:
         parser = XMLParser()
         _dict = parser.load(xml)
 
-        return SaveParser._parse(_dict)
+        return SaveParser.parse_dict(_dict)
 
     @staticmethod
     async def aio_parse(xml) -> Save:
         parser = AioXMLParser()
         _dict = await parser.load(xml)
 
-        return SaveParser._parse(_dict)
+        return SaveParser.parse_dict(_dict)
 
     @staticmethod
-    def _parse(d) -> Save:
+    def parse_dict(d) -> Save:
         completed = _get_completed(d)
         followed = _get_followed(d)
 
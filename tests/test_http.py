@@ -0,0 +1,102 @@
+import asyncio
+import gc
+import logging
+import warnings
+
+from aiohttp import web
+import pytest
+
+import gd
+from gd.utils.http_request import HTTPClient
+
+
+async def handle(request: web.Request) -> web.Response:
+    return web.Response(body=b"ok")
+
+
+async def start_server() -> web.AppRunner:
+    app = web.Application()
+    app.router.add_get("/", handle)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    return runner
+
+
+def get_url(runner: web.AppRunner) -> str:
+    host, port, *_ = runner.addresses[0]
+    return f"http://{host}:{port}/"
+
+
+@pytest.fixture
+def no_leaks(caplog):
+    caplog.set_level(logging.ERROR, logger="asyncio")
+    gc.collect()  # collect leftovers of other tests first
+
+    # asyncio.run() resets the current loop, keep the one other tests are using
+    loop = asyncio.get_event_loop_policy().get_event_loop()
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+
+        yield
+
+        asyncio.set_event_loop(loop)
+        gc.collect()
+
+    leaks = [str(warning.message) for warning in caught if warning.category is ResourceWarning]
+
+    assert not leaks
+    assert "Unclosed" not in caplog.text
+
+
+def test_session_closed_by_asyncio_run(no_leaks):
+    async def main() -> HTTPClient:
+        runner = await start_server()
+
+        client = gd.Client(loop=asyncio.get_event_loop())
+        assert await client.session.http.normal_request(get_url(runner)) == b"ok"
+
+        await runner.cleanup()
+        return client.session.http
+
+    http = asyncio.run(main())
+
+    assert http.session.closed
+
+
+def test_client_context_manager(no_leaks):
+    async def main() -> HTTPClient:
+        runner = await start_server()
+
+        async with gd.Client(loop=asyncio.get_event_loop()) as client:
+            assert await client.session.http.normal_request(get_url(runner)) == b"ok"
+
+        await runner.cleanup()
+        return client.session.http
+
+    http = asyncio.run(main())
+
+    assert http.session is None
+
+
+def test_session_recreated_on_loop_change(no_leaks):
+    http = HTTPClient()
+
+    async def main() -> object:
+        runner = await start_server()
+
+        assert await http.normal_request(get_url(runner)) == b"ok"
+
+        await runner.cleanup()
+        return http.session
+
+    first = asyncio.run(main())
+    second = asyncio.run(main())
+
+    assert first is not second
+    assert first.closed and second.closed
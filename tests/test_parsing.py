@@ -0,0 +1,60 @@
+from itertools import cycle
+
+import pytest
+
+from gd.utils.crypto.xor_cipher import xor_bytes
+from gd.utils.ng_parser import find_song_info
+from gd.utils.parser import Parser
+
+SONG_PAGE = (
+    "<title>Song Name</title>"
+    '<script>var embed = {"url":"https:\\/\\/audio.ngfiles.com\\/1000\\/1_song.mp3?f1",'
+    '"filesize":1048576,"artist":"Some Artist"};</script>'
+)
+
+
+def test_find_song_info():
+    info = find_song_info(SONG_PAGE)
+
+    assert info.link == "https://audio.ngfiles.com/1000/1_song.mp3?f1"
+    assert info.size == 1048576
+    assert info.name == "Song Name"
+    assert info.author == "Some Artist"
+
+
+def test_find_song_info_plain_link():
+    page = SONG_PAGE.replace("\\/", "/").replace("1048576,", "1048576}")
+    info = find_song_info(page)
+
+    assert info.link == "https://audio.ngfiles.com/1000/1_song.mp3?f1"
+    assert info.size == 1048576
+
+
+def test_find_song_info_escaped_json():
+    page = SONG_PAGE.replace('"', '\\"')
+    info = find_song_info(page)
+
+    assert info.link == "https://audio.ngfiles.com/1000/1_song.mp3?f1"
+    assert info.size == 1048576
+    assert info.author == "Some Artist"
+
+
+def test_find_song_info_not_found():
+    with pytest.raises(ValueError):
+        find_song_info("<title>Nothing here</title>")
+
+
+def test_parser_compile():
+    parser = Parser().split("#").take(0).split(":").add_ext({"101": 0}).should_map()
+    parse = parser.compile()
+
+    assert parse("1:a:2:b#3:c") == parser.parse("1:a:2:b#3:c") == {"1": "a", "2": "b", "101": 0}
+    assert parse(None) is None
+
+
+def test_xor_bytes():
+    data, key = b"NeKit is cool", b"93582"
+    expected = bytes(x ^ y for x, y in zip(data, cycle(key)))
+
+    assert xor_bytes(data, key) == expected
+    assert xor_bytes(expected, key) == data
@@ -0,0 +1,192 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import gd
+from gd.errors import HTTPError, MissingAccess, NothingFound
+from gd.session import Session
+from gd.utils.indexer import Index
+from gd.utils.routes import Route
+
+pytestmark = pytest.mark.asyncio
+
+ICON_ARGS = ("cube", 1, 0, 3, False, "auto")
+
+ACCOUNT_ID = 42
+USER_SEARCH_RESPONSE = f"1:NeKit:2:100:16:{ACCOUNT_ID}#0:0:10"
+
+client = SimpleNamespace(account_id=ACCOUNT_ID, encodedpass="encoded", name="NeKit")
+
+
+def stub_fetch_icon(session, monkeypatch, status=200):
+    calls = []
+
+    async def fetch_icon(*args):
+        calls.append(args)
+        await asyncio.sleep(0)  # let concurrent callers run meanwhile
+        return b"icon", status
+
+    monkeypatch.setattr(session, "fetch_icon", fetch_icon)
+
+    return calls
+
+
+def stub_request(session, monkeypatch):
+    routes = []
+
+    async def request(route, payload=None, **kwargs):
+        routes.append(route)
+
+        if route == Route.USER_SEARCH:
+            return USER_SEARCH_RESPONSE
+
+        if route == Route.GET_USER_INFO:  # stars tell how many times info was fetched
+            return f"1:NeKit:2:100:16:{ACCOUNT_ID}:3:{routes.count(route)}"
+
+        return 1
+
+    monkeypatch.setattr(session.http, "request", request)
+
+    return routes
+
+
+async def make_page(result, *, counter=None):
+    if counter is not None:  # track how many pages are fetched at the same time
+        counter["running"] += 1
+        counter["peak"] = max(counter["peak"], counter["running"])
+
+    await asyncio.sleep(0.01)
+
+    if counter is not None:
+        counter["running"] -= 1
+
+    if isinstance(result, BaseException):
+        raise result
+
+    return result
+
+
+async def test_icon_requested_once_concurrently(monkeypatch):
+    session = Session()
+    calls = stub_fetch_icon(session, monkeypatch)
+
+    icons = await asyncio.gather(*(session.generate_icon(*ICON_ARGS) for _ in range(5)))
+
+    assert icons == [b"icon"] * 5
+    assert len(calls) == 1
+    assert not session.icon_locks
+
+
+async def test_icon_error_not_cached(monkeypatch):
+    session = Session()
+    calls = stub_fetch_icon(session, monkeypatch, status=429)
+
+    await session.generate_icon(*ICON_ARGS)
+    await session.generate_icon(*ICON_ARGS)
+
+    assert len(calls) == 2
+    assert not session.icon_cache
+
+
+async def test_icon_cache_evicts_oldest(monkeypatch):
+    monkeypatch.setattr(gd.session, "ICON_CACHE_SIZE", 2)
+
+    session = Session()
+    stub_fetch_icon(session, monkeypatch)
+
+    for id in (1, 2, 3):
+        await session.generate_icon("cube", id, 0, 3, False, "auto")
+
+    assert [key[1] for key in session.icon_cache] == [2, 3]
+
+
+async def test_search_user_reuses_user_info(monkeypatch):
+    session = Session()
+    routes = stub_request(session, monkeypatch)
+
+    first = await session.search_user("NeKit")
+    second = await session.search_user("NeKit")
+
+    assert first == second
+    assert second[Index.USER_STARS] == "1"
+    assert routes.count(Route.GET_USER_INFO) == 1
+
+
+async def test_user_info_expires(monkeypatch):
+    monkeypatch.setattr(gd.session, "USER_INFO_TTL", 0)
+
+    session = Session()
+    routes = stub_request(session, monkeypatch)
+
+    await session.search_user("NeKit")
+    user = await session.search_user("NeKit")
+
+    assert user[Index.USER_STARS] == "2"
+    assert routes.count(Route.GET_USER_INFO) == 2
+
+
+async def test_get_user_refetches(monkeypatch):
+    session = Session()
+    routes = stub_request(session, monkeypatch)
+
+    await session.search_user("NeKit")
+    user = await session.get_user(ACCOUNT_ID, return_only_stats=True)
+
+    assert user[Index.USER_STARS] == "2"
+    assert routes.count(Route.GET_USER_INFO) == 2
+
+
+@pytest.mark.parametrize(
+    "update",
+    [
+        lambda session: session.update_profile({}, client=client),
+        lambda session: session.update_settings(0, 0, 0, "", "", "", client=client),
+        lambda session: session.block_user(ACCOUNT_ID, client=client),
+    ],
+    ids=["update_profile", "update_settings", "block_user"],
+)
+async def test_updates_forget_user_info(monkeypatch, update):
+    session = Session()
+    stub_request(session, monkeypatch)
+
+    await session.search_user("NeKit")
+    assert ACCOUNT_ID in session.user_info_cache
+
+    await update(session)
+    assert ACCOUNT_ID not in session.user_info_cache
+
+
+async def test_run_many_bounded():
+    session = Session(max_concurrency=3)
+    counter = {"running": 0, "peak": 0}
+
+    res = await session.run_many([make_page([page], counter=counter) for page in range(10)])
+
+    assert res == list(range(10))
+    assert counter["peak"] == 3
+
+
+async def test_run_many_drops_page_errors():
+    session = Session()
+    pages = [[1], MissingAccess("no page"), [2], NothingFound("nothing"), []]
+
+    assert await session.run_many([make_page(page) for page in pages]) == [1, 2]
+
+
+async def test_run_many_raises_http_error():
+    session = Session()
+    pages = [[1], HTTPError(OSError("connection lost")), [2]]
+
+    with pytest.raises(HTTPError):
+        await session.run_many([make_page(page) for page in pages])
+
+
+async def test_run_many_single_task():
+    session = Session()
+
+    assert await session.run_many([make_page([1, 2])]) == [1, 2]
+    assert await session.run_many([make_page(MissingAccess("no page"))]) == []
+
+    with pytest.raises(HTTPError):
+        await session.run_many([make_page(HTTPError(OSError("connection lost")))])